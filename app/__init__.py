@@ -0,0 +1,4 @@
+"""
+@package app
+@brief FastAPI application package for the MongoDB x Neo4j movie API.
+"""
@@ -0,0 +1,198 @@
+"""
+@file db
+@brief Shared MongoDB and Neo4j driver factories.
+
+This module owns the creation of the MongoDB client and the Neo4j driver. Both
+factories are memoized with functools.lru_cache, so every caller in the process
+shares a single driver object (one connection pool per process) that is created
+lazily on first use. Without the memoization, each import site or worker hook
+creating its own client multiplies the pool by the number of callers and causes
+connection storms against the databases.
+
+@attention
+This module assumes the presence of a configuration file named '.env' with the required
+environment variables, such as CONNECTION_STRING, DB_NAME, NEO4J_URI, NEO4J_USERNAME,
+and NEO4J_PASSWORD.
+"""
+from functools import lru_cache
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
+from pymongo.server_api import ServerApi
+from neo4j import READ_ACCESS, AsyncGraphDatabase
+
+from app.settings import settings
+
+
+"""
+@fn get_mongo
+@brief Return the process-wide MongoDB client, creating it on first call.
+
+Pool sizing is tunable through the settings (MONGO_MAX_POOL / MONGO_MIN_POOL in
+.env) so ops can adjust it without a code change; a warm minimum pool avoids
+paying the TCP/TLS handshake on every traffic burst.
+
+@return: The shared MongoClient instance.
+"""
+@lru_cache(maxsize=1)
+def get_mongo():
+    return AsyncIOMotorClient(
+        settings.connection_string,
+        server_api=ServerApi('1'),
+        maxPoolSize=settings.mongo_max_pool,
+        minPoolSize=settings.mongo_min_pool,
+        maxIdleTimeMS=300_000,
+        waitQueueTimeoutMS=2500,
+        retryWrites=True,
+    )
+
+
+"""
+@fn get_neo4j
+@brief Return the process-wide async Neo4j driver, creating it on first call.
+
+Explicit pool sizing and acquisition timeout keep latency flat under bursts
+instead of failing with an exhausted-pool error; both are tunable through the
+settings (NEO4J_MAX_POOL / NEO4J_ACQ_TIMEOUT in .env).
+
+@return: The shared Neo4j driver instance.
+"""
+@lru_cache(maxsize=1)
+def get_neo4j():
+    return AsyncGraphDatabase.driver(
+        settings.neo4j_uri,
+        auth=(settings.neo4j_username, settings.neo4j_password),
+        max_connection_pool_size=settings.neo4j_max_pool,
+        connection_acquisition_timeout=settings.neo4j_acq_timeout,
+        connection_timeout=15.0,
+        max_connection_lifetime=3600,
+    )
+
+
+"""
+@fn ensure_indexes
+@brief Create the MongoDB indexes the movie routes rely on.
+
+Called once from the application lifespan. Index creation is idempotent on the
+server side, so the one-time startup cost is paid per process and list/filter
+queries on year, title, directors or cast run as index scans instead of full
+collection scans.
+
+@param database: The MongoDB database instance holding the movies collection.
+"""
+async def ensure_indexes(database):
+    await database["movies"].create_indexes([
+        IndexModel([("year", 1), ("title", 1)]),
+        IndexModel([("title", 1)]),
+        IndexModel([("directors", 1)]),
+        IndexModel([("cast", 1)]),
+        IndexModel([("cast", "text")], name="cast_text"),
+    ])
+
+
+"""
+@fn neo_session
+@brief Open a Neo4j session against the configured target database.
+
+Naming the database explicitly spares the driver a routing-metadata lookup on
+every session open, and the read default access mode lets the driver route the
+movie queries (all reads today) to replicas.
+
+@param kwargs: Extra session options forwarded to the driver.
+@return: An async Neo4j session bound to the configured database.
+"""
+def neo_session(**kwargs):
+    return get_neo4j().session(
+        database=settings.neo4j_db,
+        default_access_mode=READ_ACCESS,
+        **kwargs,
+    )
+
+
+"""
+@fn neo4j_session
+@brief FastAPI dependency yielding a managed Neo4j session.
+
+Handlers that declare `session = Depends(neo4j_session)` get a read-mode session
+scoped to the request: it is acquired once per request, shared by every query the
+handler runs, and always closed when the response is sent — no leaked
+connections, and the read access mode lets the driver route to replicas.
+
+@return: An async generator yielding the request-scoped session.
+"""
+async def neo4j_session():
+    async with neo_session() as session:
+        yield session
+
+
+# Cypher used to mirror the graph's movie titles into MongoDB. DISTINCT and the
+# null filter keep the result compatible with the mirror's unique title index.
+_Q_MOVIE_TITLES = (
+    "MATCH (m:Movie) WHERE m.title IS NOT NULL RETURN DISTINCT m.title AS title"
+)
+
+
+"""
+@fn sync_neo4j_titles
+@brief Replicate Neo4j movie titles into the MongoDB 'neo4j_titles' collection.
+
+common_movies_count joins the two stores entirely inside MongoDB with a $lookup
+against this mirror collection, so the cross-store comparison never ships title
+sets over the network at request time. The mirror is built into a staging
+collection and swapped in with renameCollection, so a re-run (from a scheduler,
+e.g. nightly) never exposes a partially rebuilt mirror to concurrent lookups.
+
+@param database: The MongoDB database instance to hold the mirror collection.
+"""
+async def sync_neo4j_titles(database):
+    async with neo_session() as session:
+        result = await session.run(_Q_MOVIE_TITLES)
+        titles = [record["title"] async for record in result]
+
+    staging = database["neo4j_titles_staging"]
+    await staging.drop()
+    await staging.create_index("title", unique=True)
+    if titles:
+        await staging.insert_many([{"title": title} for title in titles], ordered=False)
+    await database.client.admin.command(
+        "renameCollection", f"{database.name}.neo4j_titles_staging",
+        to=f"{database.name}.neo4j_titles", dropTarget=True,
+    )
+
+
+# Schema statements are idempotent thanks to IF NOT EXISTS.
+_GRAPH_INDEXES = (
+    "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+    "CREATE INDEX movie_title IF NOT EXISTS FOR (m:Movie) ON (m.title)",
+)
+
+
+"""
+@fn ensure_graph_indexes
+@brief Create the Neo4j property indexes the Cypher handlers rely on.
+
+Called once from the application lifespan. Without these, matching
+(:Person {name: ...}) or (:Movie {title: ...}) is a full label scan; with them
+it is an index seek. Schema statements need a write-capable session, so this
+opens one directly instead of going through the read-mode helper.
+"""
+async def ensure_graph_indexes():
+    async with get_neo4j().session(database=settings.neo4j_db) as session:
+        for statement in _GRAPH_INDEXES:
+            await session.run(statement)
+
+
+"""
+@fn neo4j_session_eager
+@brief FastAPI dependency yielding a session that fetches results in one PULL.
+
+For endpoints whose result sets are known to be small, fetch_size=-1 tells the
+Bolt driver to deliver every record in a single PULL message instead of batching
+by the default 1000, saving a round-trip. Unbounded endpoints should keep the
+default neo4j_session so large results stay batched.
+
+@return: An async generator yielding the request-scoped session.
+"""
+async def neo4j_session_eager():
+    async with neo_session(fetch_size=-1) as session:
+        yield session
@@ -0,0 +1,57 @@
+"""
+@file main
+@brief FastAPI Application Configuration and Startup Script
+
+This script initializes and configures a FastAPI application with MongoDB and Neo4j connections.
+It includes a lifespan context manager to handle database connections.
+
+@attention
+To use this script effectively, ensure that the required dependencies in requirements.txt, are
+installed.
+This script also assumes the presence of a configuration file named '.env' with the required environment
+variables. Make sure to create this file and define the necessary variables, such as
+CONNECTION_STRING, DB_NAME, NEO4J_URI, NEO4J_USERNAME, and NEO4J_PASSWORD.
+"""
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app.db import ensure_graph_indexes, ensure_indexes, get_mongo, get_neo4j, sync_neo4j_titles
+from app.responses import BSONORJSONResponse
+from app.settings import settings
+from app.routes.movies import router as movie_router
+
+
+"""
+@fn lifespan
+@brief FastAPI lifespan context manager.
+
+Everything before the `yield` runs on application startup, everything after it on
+shutdown. Both async driver constructors are non-blocking and attach to the
+running event loop. Teardown closes both connections exactly once, even under
+uvicorn --reload.
+
+@param app: The FastAPI application instance.
+@var app.mongodb_client: MongoDB client instance for database operations.
+@var app.database: MongoDB database instance for the specified DB_NAME.
+@var app.neo4j_driver: Neo4j driver instance for database operations.
+"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.mongodb_client = get_mongo()
+    app.neo4j_driver = get_neo4j()
+    app.database = app.mongodb_client.get_database(settings.db_name)
+    await ensure_indexes(app.database)
+    await ensure_graph_indexes()
+    await sync_neo4j_titles(app.database)
+
+    yield
+
+    app.mongodb_client.close()
+    await app.neo4j_driver.close()
+
+# orjson serializes the list/dict payloads returned by the movie routes in
+# compiled code, instead of stdlib json.dumps walking them in Python.
+app = FastAPI(lifespan=lifespan, default_response_class=BSONORJSONResponse)
+
+app.include_router(movie_router, tags=["movies"], prefix="/movies")
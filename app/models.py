@@ -2,7 +2,7 @@
 @file models
 @brief Contains the definition of data models for the FastAPI application.
 
-This module defines Pydantic data models representing users, movies, and movie updates.
+This module defines Pydantic data models representing movies and movie updates.
 These models are used for request and response validation, and they include validators and
 configuration settings.
 
@@ -11,27 +11,11 @@ To use these models effectively, it's essential to ensure that the Pydantic libr
 Install it using the following command: pip install pydantic
 """
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from bson import ObjectId
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Optional, Union
-
-"""
-@class User
-@brief Represents a user in the application.
-
-@field p: An optional dictionary representing user properties.
-
-@config json_schema_extra: Additional JSON schema information for documentation and example purposes.
-"""
-class User(BaseModel):
-    p: Optional[Dict[str, str]]
-    
-    class Config:
-        json_schema_extra = {
-            "name": "Jessica Thompson"
-        }
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Dict, Optional
 
 """
 @class Movie
@@ -46,7 +30,7 @@ class User(BaseModel):
 @field title: An optional string field representing the movie's title.
 @field fullplot: An optional string field representing the full plot description of the movie.
 @field languages: An optional list of strings representing the languages in which the movie is available.
-@field released: An optional field representing the release date of the movie, either as a string or a datetime object.
+@field released: An optional field representing the release date of the movie as a datetime object.
 @field directors: An optional list of strings representing the movie's directors.
 @field writers: An optional list of strings representing the movie's writers.
 @field rated: An optional string field representing the movie's rating.
@@ -60,8 +44,7 @@ class User(BaseModel):
 @field num_mflix_comments: An optional integer field representing the number of comments for the movie.
 
 @validator convert_objectid_to_string: A pre-validation method that converts the 'id' field from ObjectId to string.
-@validator format_date: A pre-validation method that formats the 'released' field as a string.
-@validator parse_iso_date: A pre-validation method that parses the 'released' field from ISO format to datetime.
+@validator parse_release_date: A pre-validation method that parses the 'released' field from ISO format to datetime.
 
 @config json_schema_extra: Additional JSON schema information for documentation and example purposes.
 """
@@ -75,7 +58,7 @@ class Movie(BaseModel):
     title: Optional[str] = None
     fullplot: Optional[str] = None
     languages: Optional[List[str]] = None
-    released: Optional[Union[str, datetime]] = None
+    released: Optional[datetime] = None
     directors: Optional[List[str]] = None
     writers: Optional[List[str]] = None
     rated: Optional[str] = None
@@ -88,26 +71,27 @@ class Movie(BaseModel):
     tomatoes: Optional[Dict] = None
     num_mflix_comments: Optional[int] = None
 
-    @validator('id', pre=True)
+    @field_validator('id', mode='before')
+    @classmethod
     def convert_objectid_to_string(cls, v):
         if isinstance(v, ObjectId):
             return str(v)
         return v
-    @validator('released', pre=True)
-    def format_date(cls, v):
-        if isinstance(v, datetime):
-            # Format the datetime as a string (adjust the format as needed)
-            return v.strftime("%Y-%m-%d")
-        return v
-    
-    @validator("released", pre=True, allow_reuse=True)
-    def parse_iso_date(cls, value):
+
+    @field_validator('released', mode='before')
+    @classmethod
+    def parse_release_date(cls, value):
         if isinstance(value, str):
             return datetime.fromisoformat(value)
+        if isinstance(value, (int, float)):
+            # Epoch milliseconds, as stored by mongoexport-style dumps.
+            return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
         return value
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        validate_assignment=False,
+        arbitrary_types_allowed=True,
+        json_schema_extra={
             "example": {
                 "plot": "A group of bandits stage a brazen train hold-up, only to find a determined posse hot on their heels.",
                 "genres": ["Short", "Western"],
@@ -141,6 +125,7 @@ class Movie(BaseModel):
                 "num_mflix_comments": 0
             }
         }
+    )
 
 """
 @class MovieUpdate
@@ -154,7 +139,7 @@ class Movie(BaseModel):
 @field title: An optional string field representing the updated movie title.
 @field fullplot: An optional string field representing the updated full plot description of the movie.
 @field languages: An optional list of strings representing the updated languages in which the movie is available.
-@field released: An optional field representing the updated release date of the movie, either as a string or a datetime object.
+@field released: An optional field representing the updated release date of the movie as a datetime object.
 @field directors: An optional list of strings representing the updated movie directors.
 @field writers: An optional list of strings representing the updated movie writers.
 @field rated: An optional string field representing the updated movie rating.
@@ -167,7 +152,7 @@ class Movie(BaseModel):
 @field tomatoes: An optional dictionary representing Rotten Tomatoes-related information for the updated movie.
 @field num_mflix_comments: An optional integer field representing the updated number of comments for the movie.
 
-@validator parse_iso_date: A pre-validation method that parses the 'released' field from ISO format to datetime.
+@validator parse_release_date: A pre-validation method that parses the 'released' field from ISO format to datetime.
 
 @config json_schema_extra: Additional JSON schema information for documentation and example purposes.
 """
@@ -180,7 +165,7 @@ class MovieUpdate(BaseModel):
     title: Optional[str] = None
     fullplot: Optional[str] = None
     languages: Optional[List[str]] = None
-    released: Optional[Union[str, datetime]] = None
+    released: Optional[datetime] = None
     directors: Optional[List[str]] = None
     writers: Optional[List[str]] = None
     rated: Optional[str] = None
@@ -192,19 +177,19 @@ class MovieUpdate(BaseModel):
     type: Optional[str] = None
     tomatoes: Optional[Dict] = None
     num_mflix_comments: Optional[int] = None
-    
-    type: Optional[str]
-    tomatoes: Optional[dict]
-    num_mflix_comments: Optional[int]
-    
-    @validator("released", pre=True, allow_reuse=True)
-    def parse_iso_date(cls, value):
+
+    @field_validator('released', mode='before')
+    @classmethod
+    def parse_release_date(cls, value):
         if isinstance(value, str):
             return datetime.fromisoformat(value)
+        if isinstance(value, (int, float)):
+            # Epoch milliseconds, as stored by mongoexport-style dumps.
+            return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
         return value
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "plot": "Updated plot description",
                 "genres": ["Drama", "Thriller"],
@@ -233,3 +218,5 @@ class MovieUpdate(BaseModel):
                 "num_mflix_comments": 10
             }
         }
+    )
+
@@ -0,0 +1,25 @@
+"""
+@file responses
+@brief Response classes shared by the application and its route modules.
+
+Lives in its own module so route handlers can return the response class
+directly without importing main (which imports the routes back).
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+"""
+@class BSONORJSONResponse
+@brief ORJSONResponse that understands the BSON types the routes return.
+
+orjson serializes dicts, lists, str, int, float and datetime natively; the
+default=str fallback covers what is left in documents coming straight from
+MongoDB — in practice the ObjectId under '_id'. OPT_NON_STR_KEYS tolerates
+non-string dictionary keys in stored sub-documents.
+"""
+class BSONORJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,4 @@
+"""
+@package app.routes
+@brief API route modules.
+"""
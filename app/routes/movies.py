@@ -0,0 +1,367 @@
+"""
+@file movies
+@brief FastAPI Movie API
+
+This module defines FastAPI routes for managing movies, including listing, searching, updating,
+and retrieving information about movies and users.
+
+@note This API assumes the use of MongoDB and Neo4j databases for storing movie and user
+        information.
+
+@attention  Before running this API, ensure that the required dependencies, such as FastAPI,
+    PyMongo, and Neo4j, are installed.
+
+@section movies_routes Movie Routes
+This section contains FastAPI routes related to movie management.
+"""
+
+import asyncio
+import re
+from typing import Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from bson.regex import Regex
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, Depends, Request, HTTPException, status
+from pymongo import ReturnDocument
+
+from app.db import neo4j_session, neo4j_session_eager
+from app.models import Movie, MovieUpdate
+from app.responses import BSONORJSONResponse
+
+# Init the API Router
+router = APIRouter()
+
+# The Movie field set is introspected exactly once, at import, and frozen; no
+# per-request walk over Movie.model_fields ever happens on the query paths.
+_MOVIE_FIELDS = frozenset(
+    field.alias or name for name, field in Movie.model_fields.items()
+)
+
+# Full document shape: only fetches the fields the Movie model actually
+# carries, including _id. On the raw list/search paths the handlers return a
+# BSONORJSONResponse themselves, so orjson's default=str stringifies the
+# ObjectId; a bare-dict return would instead hit jsonable_encoder, which
+# rejects ObjectId.
+MOVIE_PROJECTION = {name: 1 for name in _MOVIE_FIELDS}
+
+# Joins movies against the neo4j_titles mirror collection (kept in sync by
+# db.sync_neo4j_titles) entirely inside MongoDB, using the mirror's unique title
+# index for the lookup.
+_COMMON_MOVIES_PIPELINE = [
+    {"$lookup": {"from": "neo4j_titles", "localField": "title",
+                 "foreignField": "title", "as": "matched"}},
+    {"$match": {"matched": {"$ne": []}}},
+    {"$group": {"_id": None, "titles": {"$addToSet": "$title"}}},
+]
+
+# The common-movies result only changes when a store changes, so repeated calls
+# within a minute share one entry; the lock single-flights concurrent misses so
+# a burst of requests triggers exactly one aggregation.
+_common_cache = TTLCache(maxsize=1, ttl=60)
+_common_lock = asyncio.Lock()
+
+# Cypher statements are hoisted to module-level constants: Neo4j's plan cache is
+# keyed on exact string identity, so passing the same interned literal on every
+# request keeps the parse/plan step a guaranteed cache hit.
+_Q_USERS_RATED = "MATCH (p:Person)-[:REVIEWED]->(:Movie {title: $title}) RETURN p"
+_Q_MOVIES_RATED_BY = (
+    "MATCH (:Person {name:$name})-[:REVIEWED]->(m:Movie) RETURN m.title AS title"
+)
+
+
+"""
+@fn parse_oid
+@brief Parse and validate a movie identifier.
+
+FastAPI dependency that converts the hexadecimal `id` path parameter into an
+ObjectId once, before the handler body runs, so malformed identifiers are
+rejected with a 422 instead of surfacing the driver's InvalidId as a 500.
+
+@param id: The hexadecimal string identifier from the path.
+@return: The parsed ObjectId.
+@exception HTTPException: If the identifier is not a valid ObjectId, a 422 error is raised.
+"""
+def parse_oid(id: str) -> ObjectId:
+    try:
+        return ObjectId(id)
+    except InvalidId:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=f"'{id}' is not a valid movie id")
+
+
+"""
+@fn list_movies
+@brief List all movies.
+
+This route returns a list of movies from the MongoDB database.
+
+@param request: The FastAPI Request object.
+@return: A list of movies.
+@exception HTTPException: If movies are not found, a 404 error is raised.
+"""
+@router.get("/", response_description="List all movies")
+async def list_movies(request: Request):
+    # Fetch only the summary fields the listing displays; the projection shrinks
+    # both the wire payload and the response body.
+    cursor = request.app.database["movies"].find(
+        {}, projection={"title": 1, "year": 1, "poster": 1}
+    ).limit(10)
+    if movies := await cursor.to_list(10):
+        # Returning the response object directly hands the raw documents straight
+        # to orjson: FastAPI's serialize_response / jsonable_encoder walk (which
+        # rejects the ObjectId under _id) never runs.
+        return BSONORJSONResponse(movies)
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Movies not found")
+
+
+"""
+@fn search_movies
+@brief Search for a movie by title or actor.
+
+This route allows searching for movies based on title or actor.
+Title search is a case-insensitive prefix match; actor search runs against the
+text index on cast.
+
+@param request: The FastAPI Request object.
+@param title: Optional. The title of the movie to search for.
+@param actor: Optional. The actor's name to search for.
+@exception HTTPException: If no movie with the specified title or actor is found,
+a 404 error is raised.
+
+@return: A list of matching movies.
+"""
+@router.get("/search/", response_description="Search for a movie by title or actor")
+async def search_movies(request: Request, title: Optional[str] = None, actor: Optional[str] = None):
+    query = {}
+    if title:
+        # Anchored case-insensitive prefix match. $regex is not collation-aware,
+        # so a case-insensitive pattern cannot be served from an index without a
+        # lowercase shadow field; the anchor keeps the per-document match cheap
+        # while preserving the original case-insensitive semantics.
+        query["title"] = Regex(f"^{re.escape(title)}", "i")
+
+    if actor:
+        # Inverted-index lookup on the cast text index instead of a regex
+        # collection scan; best matches first, bounded result set.
+        query["$text"] = {"$search": actor}
+        cursor = (
+            request.app.database["movies"]
+            .find(query, {**MOVIE_PROJECTION, "score": {"$meta": "textScore"}})
+            .sort([("score", {"$meta": "textScore"})])
+            .limit(50)
+        )
+    else:
+        cursor = request.app.database["movies"].find(query, MOVIE_PROJECTION).limit(100)
+
+    movies = await cursor.to_list(length=None)
+    if movies:
+        # Direct response: skip the jsonable_encoder walk, as in list_movies.
+        return BSONORJSONResponse(movies)
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Movies not found")
+
+
+"""
+@fn update_movie_by_title
+@brief Update a movie by title.
+
+This route allows updating movie information, including title, plot, genres, etc.,
+based on the specified title.
+
+@param request: The FastAPI Request object.
+@param title: The title of the movie to update.
+@param movie: The updated movie information.
+@return: The updated movie.
+@exception HTTPException: If the update contains no fields, a 400 error is raised.
+@exception HTTPException: If the movie with the specified title is not found, a 404 error is raised.
+
+@see models.Movie
+@see models.MovieUpdate
+"""
+@router.put("/update/", response_description="Update a movie by title", response_model=Movie)
+async def update_movie_by_title(request: Request, title: str, movie: MovieUpdate = Body(...)):
+    movie_data = movie.model_dump(exclude_unset=True, exclude_none=True)
+
+    # Client error, not a read: an empty patch is rejected before any round-trip.
+    if not movie_data:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="No fields to update")
+
+    # One round-trip: apply the update and get the post-update document back.
+    updated_movie = await request.app.database["movies"].find_one_and_update(
+        {"title": title}, {"$set": movie_data},
+        return_document=ReturnDocument.AFTER, projection=MOVIE_PROJECTION,
+    )
+
+    if updated_movie:
+        return updated_movie
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Movie with title '{title}' not found")
+
+
+"""
+@fn common_movies_count
+@brief Count of movies common between MongoDB and Neo4j databases.
+
+This route joins the movies collection against the synced neo4j_titles mirror and
+returns the count along with a list of common movie titles. Results are cached for
+60 seconds, and concurrent cache misses share a single aggregation.
+
+@param request: The FastAPI Request object.
+@return: A dictionary containing the common movies count and a list of common movie titles.
+@exception HTTPException: If common movies are not found, a 404 error is raised.
+"""
+@router.get("/common_movies_count",
+            response_description="Count of movies common between MongoDB and Neo4j")
+async def common_movies_count(request: Request):
+    async with _common_lock:
+        if (cached := _common_cache.get("common_movies")) is not None:
+            return cached
+
+        rows = await request.app.database["movies"].aggregate(_COMMON_MOVIES_PIPELINE).to_list(1)
+        if rows and rows[0]["titles"]:
+            titles = rows[0]["titles"]
+            payload = {"common_movies_count": len(titles), "m.title": titles}
+            _common_cache["common_movies"] = payload
+            return payload
+    
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Common movies not found")       
+
+
+"""
+@fn users_rated_movie
+@brief List all users who rated a specified movie.
+
+This route retrieves information about users who have reviewed and rated a specific movie in the
+Neo4j database.
+
+@param request: The FastAPI Request object.
+@param title: The title of the movie to retrieve user ratings.
+@return: A list of users who rated the specified movie, as property dictionaries.
+@exception HTTPException: If users who rated the movie are not found, a 404 error is raised.
+"""
+@router.get("/users_rated_movie/", response_description="List all users who rated a movie")
+async def users_rated_movie(request: Request, title: str,
+                            session=Depends(neo4j_session_eager)):
+    async def work(tx):
+        # Materialize each Person node to a plain property dict while the
+        # transaction is still open; the records are unreachable after it closes.
+        result = await tx.run(_Q_USERS_RATED, title=title)
+        return [dict(record["p"]) async for record in result]
+
+    # execute_read retries transient failures and keeps the read routing hint.
+    users = await session.execute_read(work)
+
+    if users:
+        return users
+
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Users who rated movie '{title}' not found")
+
+
+"""
+@fn movies_rated_by_user
+@brief List all movies rated by a user.
+
+This route retrieves information about movies that a specific user has reviewed and rated in the
+Neo4j database.
+
+@param request: The FastAPI Request object.
+@param name: The name of the user to retrieve rated movies.
+@return: The user's name, the number of movies rated, and their titles.
+@exception HTTPException: If movies rated by the user are not found, a 404 error is raised.
+"""
+@router.get("/movies_rated_by_user/", response_description="List all movies rated by a user")
+async def movies_rated_by_user(request: Request, name: str, session=Depends(neo4j_session)):
+    async def work(tx):
+        # Project just the title per row and stream: no COLLECT materializing every
+        # node's full property map into one row on the server.
+        result = await tx.run(_Q_MOVIES_RATED_BY, name=name)
+        return [record["title"] async for record in result]
+
+    titles = await session.execute_read(work)
+
+    if titles:
+        return {"user": name, "count": len(titles), "movies": titles}
+
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Movies rated by user '{name}' not found")
+
+
+"""
+@fn create_movie
+@brief Create a new movie.
+
+This route inserts a new movie into the MongoDB database. The inserted document is
+returned directly with its generated identifier — no re-read round-trip is issued.
+
+@param request: The FastAPI Request object.
+@param movie: The movie to create.
+@return: The created movie.
+
+@see models.Movie
+"""
+@router.post("/", response_description="Create a new movie", response_model=Movie,
+             status_code=status.HTTP_201_CREATED)
+async def create_movie(request: Request, movie: Movie = Body(...)):
+    # model_dump(mode='json') does the same conversion as jsonable_encoder but in
+    # pydantic-core instead of a Python-level walk over every field.
+    document = movie.model_dump(mode='json', by_alias=True, exclude_none=True)
+    if "id" not in movie.model_fields_set:
+        # Let MongoDB assign a real ObjectId: the uuid4 default on Movie.id is not
+        # a valid ObjectId, so a document inserted with it could never be reached
+        # through the /{id} routes.
+        document.pop("_id", None)
+    new_movie = await request.app.database["movies"].insert_one(document)
+    document["_id"] = new_movie.inserted_id
+    return document
+
+
+"""
+@fn find_movie
+@brief Find a movie by its identifier.
+
+This route returns a single movie from the MongoDB database, looked up by its
+ObjectId. Identifier parsing is handled by the parse_oid dependency.
+
+@param request: The FastAPI Request object.
+@param oid: The ObjectId of the movie, parsed by parse_oid.
+@return: The matching movie.
+@exception HTTPException: If no movie with the specified id is found, a 404 error is raised.
+
+@see models.Movie
+"""
+@router.get("/{id}", response_description="Get a movie by id", response_model=Movie)
+async def find_movie(request: Request, oid: ObjectId = Depends(parse_oid)):
+    if movie := await request.app.database["movies"].find_one({"_id": oid}):
+        return movie
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Movie with id '{oid}' not found")
+
+
+"""
+@fn delete_movie
+@brief Delete a movie by its identifier.
+
+This route removes a movie from the MongoDB database. The route is declared with
+status 204, so a successful delete returns no body and no encoder runs at all.
+
+@param request: The FastAPI Request object.
+@param oid: The ObjectId of the movie, parsed by parse_oid.
+@exception HTTPException: If no movie with the specified id is found, a 404 error is raised.
+"""
+@router.delete("/{id}", response_description="Delete a movie by id",
+               status_code=status.HTTP_204_NO_CONTENT)
+async def delete_movie(request: Request, oid: ObjectId = Depends(parse_oid)):
+    delete_result = await request.app.database["movies"].delete_one({"_id": oid})
+    if delete_result.deleted_count == 1:
+        return None
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Movie with id '{oid}' not found")
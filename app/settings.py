@@ -0,0 +1,50 @@
+"""
+@file settings
+@brief Application configuration loaded once from the .env file.
+
+This module replaces ad-hoc dotenv_values dict lookups with a frozen
+pydantic-settings object: values are read, type-coerced and validated a single
+time at import, misconfiguration fails at startup instead of mid-request, and
+callers use attribute access instead of re-indexing a dict by string key.
+
+@attention
+This module assumes the presence of a configuration file named '.env' with the required
+environment variables, such as CONNECTION_STRING, DB_NAME, NEO4J_URI, NEO4J_USERNAME,
+and NEO4J_PASSWORD.
+"""
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+"""
+@class Settings
+@brief Typed, immutable view of the .env configuration.
+
+@field connection_string: The MongoDB connection string.
+@field db_name: The name of the MongoDB database.
+@field neo4j_uri: The URI of the Neo4j database.
+@field neo4j_username: The username of the Neo4j database.
+@field neo4j_password: The password of the Neo4j database.
+@field neo4j_db: The target Neo4j database name for sessions.
+@field mongo_max_pool: Maximum size of the MongoDB connection pool.
+@field mongo_min_pool: Minimum (warm) size of the MongoDB connection pool.
+@field neo4j_max_pool: Maximum size of the Neo4j connection pool.
+@field neo4j_acq_timeout: Timeout in seconds to acquire a Neo4j connection from the pool.
+
+@config env_file: Values are read from '.env'; frozen makes the instance immutable.
+"""
+class Settings(BaseSettings):
+    connection_string: str
+    db_name: str
+    neo4j_uri: str
+    neo4j_username: str
+    neo4j_password: str
+    neo4j_db: str = "neo4j"
+    mongo_max_pool: int = 200
+    mongo_min_pool: int = 10
+    neo4j_max_pool: int = 100
+    neo4j_acq_timeout: float = 30.0
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+
+settings = Settings()